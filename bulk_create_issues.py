@@ -1,26 +1,111 @@
 #!/usr/bin/env python3
 """
 Bulk create GitHub issues from JSON files
+
+The work is I/O-bound: almost all of the time goes to round trips to the
+GitHub API. Issues are therefore created in batches of aliased GraphQL
+createIssue mutations, with the REST API as a concurrent fallback.
+
+Requests use plain HTTP/1.1 keep-alive (requests has no HTTP/2). GitHub
+caps issue creation at about 20 per minute, so multiplexing over HTTP/2
+would not make a run any faster; a handful of pooled connections is enough.
 """
 
+import hashlib
 import json
 import os
+import re
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
 from pathlib import Path
+from urllib.parse import quote
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("Error: requests module not found")
     print("Install with: pip install requests")
     sys.exit(1)
 
+# orjson is optional: a faster drop-in for all JSON encoding and decoding,
+# both the issue files and API request/response bodies
+try:
+    import orjson
+    json_loads, json_dumps = orjson.loads, orjson.dumps
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(data):
+        return json.dumps(data).encode()
+
 # Configuration
 REPO_OWNER = "krisapplegate"
 REPO_NAME = "kiro-simple-tracker"
-GITHUB_API_URL = f"https://api.github.com/repos/{REPO_OWNER}/{REPO_NAME}/issues"
+GITHUB_REPO_URL = f"https://api.github.com/repos/{REPO_OWNER}/{REPO_NAME}"
+GITHUB_API_URL = f"{GITHUB_REPO_URL}/issues"
+GITHUB_LABELS_URL = f"{GITHUB_REPO_URL}/labels"
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
 ISSUES_DIR = "github-issues"
+ISSUE_FILE_PATTERN = re.compile(r"phase(\d+)-issue(\d+)\.json")
+CACHE_FILE = ".bulk_create_cache.json"  # Issues created so far, plus the last issue listing
+
+# Colors for labels the script has to create (see github-issues/README.md)
+LABEL_COLORS = {
+    "critical": "d73a4a",
+    "high-priority": "ff6b00",
+    "medium-priority": "fbca04",
+    "low-priority": "0e8a16",
+}
+DEFAULT_LABEL_COLOR = "ededed"
+
+# Concurrency and rate limiting
+MAX_WORKERS = 5      # Issues in flight at once
+READ_WORKERS = 8     # Issue files read in parallel
+RATE_LIMIT = 20      # Issue creations allowed...
+RATE_PERIOD = 60     # ...per this many seconds (GitHub secondary rate limit)
+MAX_ATTEMPTS = 3     # Tries per issue when GitHub says we are rate limited
+GRAPHQL_BATCH_SIZE = 20  # createIssue mutations per GraphQL request (keeps query cost low)
+
+# Reported for creations that failed in a way that does not say whether
+# GitHub created the issue; they are never re-sent within a run
+UNKNOWN_OUTCOME = "outcome unknown, not retried to avoid duplicates (re-run to finish)"
+
+class RateLimiter:
+    """Thread-safe token bucket allowing `rate` acquisitions per `period` seconds"""
+
+    def __init__(self, rate, period):
+        self.capacity = rate
+        self.tokens = float(rate)
+        self.fill_rate = rate / period
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def pause(self, seconds):
+        """Hold back every caller for `seconds`, e.g. when GitHub asks us to"""
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                else:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.fill_rate
+            time.sleep(wait)
 
 def get_github_token():
     """Get GitHub token from environment"""
@@ -38,27 +123,324 @@ def get_github_token():
         sys.exit(1)
     return token
 
-def create_issue(token, issue_data, filename):
-    """Create a single GitHub issue"""
-    headers = {
+def list_issue_files():
+    """List issue files ordered numerically by phase, then issue number"""
+    with os.scandir(ISSUES_DIR) as entries:
+        issue_files = [
+            (tuple(map(int, match.groups())), entry)
+            for entry in entries
+            if (match := ISSUE_FILE_PATTERN.fullmatch(entry.name))
+        ]
+    issue_files.sort(key=lambda item: item[0])
+    return [entry for _, entry in issue_files]
+
+def load_issue(issue_file):
+    """Read and parse one issue file, pre-encoding its REST request body"""
+    with open(issue_file.path, 'rb') as f:
+        issue_data = json_loads(f.read())
+    return issue_file.name, issue_data, json_dumps(issue_data)
+
+def load_cache():
+    """Load the cache left by a previous run, if any"""
+    try:
+        return json_loads(Path(CACHE_FILE).read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(cache):
+    """Write the cache atomically so an interrupted run cannot corrupt it"""
+    tmp_file = f"{CACHE_FILE}.tmp"
+    Path(tmp_file).write_bytes(json_dumps(cache))
+    os.replace(tmp_file, CACHE_FILE)
+
+def issue_key(title):
+    """Cache key for an issue: stable across runs, scoped to this repository"""
+    return hashlib.blake2b(f"{REPO_OWNER}/{REPO_NAME}|{title}".encode(), digest_size=16).hexdigest()
+
+def cached_get(session, url, params, cache, key, extract):
+    """GET every page of a listing, revalidating each page with its ETag from the previous run
+
+    `extract` reduces one page of items to a list of what is worth keeping
+    in the cache; the result is those lists concatenated. Every page is
+    requested, since a change on a later page does not change the first
+    one, but a page that comes back 304 reuses the values kept last time
+    and does not count against the rate limit.
+    """
+    old_pages = (cache.get(key) or {}).get('pages', [])
+    pages = []
+    page_url, page_params = url, params
+    while page_url:
+        old = old_pages[len(pages)] if len(pages) < len(old_pages) else None
+        if old and old['url'] != page_url:
+            old = None
+        headers = {'If-None-Match': old['etag']} if old and old.get('etag') else {}
+        response = session.get(page_url, params=page_params, headers=headers, timeout=30)
+        if response.status_code == 304 and old:
+            page = old
+        else:
+            response.raise_for_status()
+            # The next URL already carries the query string
+            page = {
+                'url': page_url,
+                'etag': response.headers.get('ETag'),
+                'value': extract(json_loads(response.content)),
+                'next': response.links.get('next', {}).get('url'),
+            }
+        pages.append(page)
+        page_url, page_params = page['next'], None
+
+    cache[key] = {'pages': pages}
+    return [value for page in pages for value in page['value']]
+
+def get_existing_titles(session, cache):
+    """Get titles of issues already in the repository"""
+    # The issues endpoint also lists pull requests
+    titles = cached_get(
+        session, GITHUB_API_URL, {"state": "all", "per_page": 100}, cache, 'issues',
+        lambda issues: [issue['title'] for issue in issues if 'pull_request' not in issue]
+    )
+    return set(titles)
+
+def ensure_labels(session, issues, cache):
+    """Create any labels the issues use that the repository does not have yet
+
+    Doing this once up front means issues never wait on GitHub creating
+    labels for them. Returns (label_ids, created, failed): the node ID of
+    every known label by name, which GraphQL needs, and the missing labels
+    that are now available (created, or found to exist after all) and
+    those that could not be created.
+    """
+    wanted = set().union(*(issue_data.get('labels', []) for _, issue_data, _ in issues))
+    label_ids = dict(cached_get(
+        session, GITHUB_LABELS_URL, {"per_page": 100}, cache, 'labels',
+        lambda labels: [(label['name'], label['node_id']) for label in labels]
+    ))
+    missing = sorted(wanted - label_ids.keys())
+
+    def create_label(name):
+        body = json_dumps({"name": name, "color": LABEL_COLORS.get(name, DEFAULT_LABEL_COLOR)})
+        try:
+            response = session.post(GITHUB_LABELS_URL, data=body, timeout=30)
+            if response.status_code == 422:
+                # Already exists: created since the listing, or by a retried
+                # POST whose first attempt succeeded. Look up its node ID.
+                response = session.get(f"{GITHUB_LABELS_URL}/{quote(name, safe='')}", timeout=30)
+                if response.status_code != 200:
+                    return None
+            elif response.status_code != 201:
+                return None
+        except requests.RequestException:
+            return None
+        return json_loads(response.content)['node_id']
+
+    # Label POSTs are small and independent, so overlap their round trips
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        node_ids = list(executor.map(create_label, missing))
+
+    created, failed = [], []
+    for name, node_id in zip(missing, node_ids):
+        if node_id:
+            label_ids[name] = node_id
+            created.append(name)
+        else:
+            failed.append(name)
+    return label_ids, created, failed
+
+def create_session(token):
+    """Create an authenticated session that keeps connections to GitHub alive
+
+    main() creates one session and every worker shares it for the whole
+    run, so DNS, TCP and TLS setup happen once per pooled connection and
+    the auth headers are set once rather than per request.
+    """
+    session = requests.Session()
+    # requests already sends Accept-Encoding: gzip and transparently inflates
+    # responses, which matters for the issue listing. Request bodies go out
+    # uncompressed: the GitHub API does not accept Content-Encoding on them.
+    session.headers.update({
         "Authorization": f"token {token}",
         "Accept": "application/vnd.github.v3+json",
         "Content-Type": "application/json"
-    }
+    })
+    retries = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=["GET", "POST"]
+    )
+    # One keep-alive connection per worker; block rather than open extra
+    # connections that would be thrown away
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS, pool_block=True, max_retries=retries)
+    session.mount("https://", adapter)
+    # GitHub can answer POST /issues with a 502 after creating the issue, and
+    # it does not reject duplicate titles. Only retry an issue POST if the
+    # connection failed, where nothing was sent; GETs of the issue listing
+    # keep the usual retries.
+    issue_retries = Retry(
+        total=5,
+        connect=5,
+        other=0,
+        backoff_factor=0.5,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=["GET"]
+    )
+    session.mount(GITHUB_API_URL, HTTPAdapter(
+        pool_connections=1, pool_maxsize=MAX_WORKERS, pool_block=True, max_retries=issue_retries
+    ))
+    # A GraphQL batch creates up to GRAPHQL_BATCH_SIZE issues, and GitHub can
+    # answer a long mutation with a 502 after creating them. Only retry
+    # failures to connect, where nothing was sent, never a sent mutation.
+    graphql_retries = Retry(total=5, connect=5, read=0, status=0, other=0, backoff_factor=0.5,
+                            allowed_methods=["POST"])
+    session.mount(GITHUB_GRAPHQL_URL, HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=graphql_retries))
+    return session
+
+def check_access(session):
+    """Fail fast if the token or repository is wrong; returns the repository's node ID
+
+    This also warms the connection pool, and the node ID it returns is all
+    GraphQL needs, so the repository is never looked up again.
+    """
+    try:
+        response = session.get(GITHUB_REPO_URL, timeout=10)
+    except requests.RequestException as e:
+        print(f"❌ Error: could not reach GitHub: {e}")
+        sys.exit(1)
 
+    if response.status_code == 401:
+        print("❌ Error: GITHUB_TOKEN was rejected (401 Unauthorized)")
+        sys.exit(1)
+    if response.status_code == 404:
+        print(f"❌ Error: repository {REPO_OWNER}/{REPO_NAME} not found or not accessible with this token")
+        sys.exit(1)
+    if response.status_code != 200:
+        print(f"❌ Error: unexpected response checking repository access: HTTP {response.status_code}")
+        sys.exit(1)
+    return json_loads(response.content)['node_id']
+
+def retry_after_seconds(value):
+    """Seconds to wait for a Retry-After header: a number of seconds or an HTTP date"""
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return max(0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return RATE_PERIOD
+
+def throttle(response, limiter):
+    """Apply GitHub's rate-limit headers to the limiter; True if the request should be retried"""
+    retry_after = response.headers.get('Retry-After')
+    remaining = response.headers.get('X-RateLimit-Remaining')
+    reset = response.headers.get('X-RateLimit-Reset')
+    rate_limited = response.status_code in (403, 429)
+
+    if retry_after:
+        limiter.pause(retry_after_seconds(retry_after))
+    elif remaining == '0' and reset:
+        limiter.pause(max(0, int(reset) - time.time()))
+    elif rate_limited and 'rate limit' in response.text.lower():
+        # Secondary limits without a Retry-After: GitHub asks for at least a minute
+        limiter.pause(RATE_PERIOD)
+    else:
+        return False
+    return rate_limited
+
+def create_issue(session, body, limiter):
+    """Create a single GitHub issue from its encoded request body"""
     try:
-        response = requests.post(GITHUB_API_URL, headers=headers, json=issue_data)
+        for _ in range(MAX_ATTEMPTS):
+            limiter.acquire()
+            response = session.post(GITHUB_API_URL, data=body, timeout=30)
+            if not throttle(response, limiter):
+                break
 
         if response.status_code == 201:
-            issue_url = response.json().get('html_url')
-            issue_number = response.json().get('number')
-            return True, issue_number, issue_url
-        else:
-            error_msg = response.json().get('message', 'Unknown error')
-            return False, None, error_msg
+            payload = json_loads(response.content)
+            return True, payload.get('number'), payload.get('html_url')
+
+        if response.status_code >= 500:
+            # The issue may exist anyway; a re-run skips it by title
+            return False, None, f"HTTP {response.status_code}, {UNKNOWN_OUTCOME}"
+
+        try:
+            error_msg = json_loads(response.content).get('message', 'Unknown error')
+        except ValueError:
+            error_msg = f"HTTP {response.status_code}: {response.text[:200]}"
+        return False, None, error_msg
+    except requests.RequestException as e:
+        # A timeout or dropped connection after sending: same as a 5xx
+        return False, None, f"{UNKNOWN_OUTCOME}: {e}"
     except Exception as e:
         return False, None, str(e)
 
+def graphql(session, query, variables, limiter):
+    """Run a GraphQL request and return its data, raising on errors"""
+    for _ in range(MAX_ATTEMPTS):
+        body = json_dumps({"query": query, "variables": variables})
+        response = session.post(GITHUB_GRAPHQL_URL, data=body, timeout=60)
+        if not throttle(response, limiter):
+            break
+    response.raise_for_status()
+    payload = json_loads(response.content)
+    data = payload.get('data')
+    if payload.get('errors') and not data:
+        raise RuntimeError(payload['errors'][0].get('message', 'Unknown GraphQL error'))
+    if data is None:
+        # Neither data nor errors: no way to tell what GitHub did
+        raise ValueError("GraphQL response has no data")
+    return data
+
+def create_issues_graphql(session, issues, limiter, repository_id, label_ids):
+    """Create issues in batches of aliased createIssue mutations
+
+    `issues` is a list of (filename, issue_data, body) whose labels all
+    have an ID in `label_ids`. Yields {filename: result} as each batch
+    finishes: created issues as successes, and every issue in a batch
+    whose outcome is unknown (a timeout or a 5xx) as a failure, so it is
+    never re-posted. Issues GitHub rejected are left out for REST to retry.
+    """
+    for start in range(0, len(issues), GRAPHQL_BATCH_SIZE):
+        batch = issues[start:start + GRAPHQL_BATCH_SIZE]
+        params = ["$repo: ID!"]
+        fields = []
+        variables = {"repo": repository_id}
+        for i, (_, issue_data, _) in enumerate(batch):
+            params.append(f"$t{i}: String!, $b{i}: String, $l{i}: [ID!]")
+            fields.append(
+                f"i{i}: createIssue(input: {{repositoryId: $repo, title: $t{i}, body: $b{i}, labelIds: $l{i}}}) "
+                "{ issue { number url } }"
+            )
+            variables[f"t{i}"] = issue_data['title']
+            variables[f"b{i}"] = issue_data.get('body')
+            variables[f"l{i}"] = [label_ids[label] for label in issue_data.get('labels', [])]
+        mutation = f"mutation({', '.join(params)}) {{\n  " + "\n  ".join(fields) + "\n}"
+
+        for _ in batch:
+            limiter.acquire()
+        try:
+            data = graphql(session, mutation, variables, limiter)
+        except (requests.RequestException, RuntimeError, ValueError) as e:
+            # RuntimeError is GraphQL refusing the whole batch, and a 4xx is
+            # the request being refused: nothing was created either way
+            if isinstance(e, RuntimeError) or (isinstance(e, requests.HTTPError) and e.response.status_code < 500):
+                print(f"⚠ GraphQL batch rejected, falling back to REST: {e}")
+                continue
+            # Otherwise some or all of the batch may exist; a re-run skips
+            # those by title
+            message = f"GraphQL batch {UNKNOWN_OUTCOME}: {e}"
+            yield {filename: (False, None, message) for filename, _, _ in batch}
+            continue
+
+        results = {}
+        for i, (filename, _, _) in enumerate(batch):
+            created = data.get(f"i{i}")
+            if created:
+                issue = created['issue']
+                results[filename] = (True, issue['number'], issue['url'])
+        yield results
+
 def main():
     print("=" * 60)
     print("  GitHub Bulk Issue Creator")
@@ -74,19 +456,52 @@ def main():
     # Get GitHub token
     token = get_github_token()
     print("✓ GitHub token found")
+
+    session = create_session(token)
+    repository_id = check_access(session)
+    print(f"✓ Repository {REPO_OWNER}/{REPO_NAME} is accessible")
     print()
 
     # Get all issue JSON files
-    issue_files = sorted(Path(ISSUES_DIR).glob("phase*.json"))
+    issue_files = list_issue_files()
     print(f"Found {len(issue_files)} issue files")
     print()
 
+    # Parse every file once, overlapping the reads; the same data is
+    # previewed and then sent
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+        issues = list(executor.map(load_issue, issue_files))
+
+    # Skip issues that already exist so re-runs do not create duplicates:
+    # anything a previous run recorded as created, or found in the listing
+    cache = load_cache()
+    cache.setdefault('created', {})
+    try:
+        existing_titles = get_existing_titles(session, cache)
+        save_cache(cache)
+    except (requests.RequestException, ValueError) as e:
+        print(f"⚠ Could not list existing issues, only previously created ones will be skipped: {e}")
+        existing_titles = set()
+
+    def exists(issue_data):
+        return issue_data['title'] in existing_titles or issue_key(issue_data['title']) in cache['created']
+
+    skipped = [filename for filename, issue_data, _ in issues if exists(issue_data)]
+    issues = [issue for issue in issues if not exists(issue[1])]
+
+    if skipped:
+        print(f"Skipping {len(skipped)} issues that already exist:")
+        for filename in skipped:
+            print(f"  - {filename}")
+        print()
+    if not issues:
+        print("✓ All issues already exist, nothing to do.")
+        sys.exit(0)
+
     # Confirm before creating
     print("This will create the following issues:")
-    for issue_file in issue_files:
-        with open(issue_file) as f:
-            data = json.load(f)
-        print(f"  - {issue_file.name}: {data['title']}")
+    for filename, issue_data, _ in issues:
+        print(f"  - {filename}: {issue_data['title']}")
     print()
 
     response = input("Proceed with creating these issues? [y/N]: ")
@@ -99,34 +514,100 @@ def main():
     created = []
     failed = []
 
+    try:
+        label_ids, created_labels, failed_labels = ensure_labels(session, issues, cache)
+        save_cache(cache)
+        if created_labels:
+            print(f"✓ Created {len(created_labels)} missing labels")
+        if failed_labels:
+            print(f"⚠ Could not create labels: {', '.join(failed_labels)}")
+    except (requests.RequestException, ValueError, KeyError) as e:
+        print(f"⚠ Could not check repository labels, using REST for all issues: {e}")
+        label_ids = None
+    print()
+
     print("Creating issues...")
     print("-" * 60)
 
-    for issue_file in issue_files:
-        with open(issue_file) as f:
-            issue_data = json.load(f)
+    # Issues GraphQL cannot create (labels without a known ID) go straight
+    # to the REST workers and run alongside the GraphQL batches; anything a
+    # batch fails on follows them. The limiter keeps both paths under
+    # GitHub's content-creation limit.
+    limiter = RateLimiter(RATE_LIMIT, RATE_PERIOD)
+    cache_lock = threading.Lock()
 
-        print(f"Creating: {issue_file.name}...", end=" ")
+    def record_created(titles_and_numbers):
+        """Record issues in the cache as soon as they exist, so an interrupted run never creates them again"""
+        with cache_lock:
+            for title, issue_number in titles_and_numbers:
+                cache['created'][issue_key(title)] = issue_number
+            save_cache(cache)
 
-        success, issue_number, result = create_issue(token, issue_data, issue_file.name)
+    def submit_rest(executor, issue):
+        _, issue_data, body = issue
+        future = executor.submit(create_issue, session, body, limiter)
 
-        if success:
-            print(f"✓ #{issue_number}")
-            print(f"  URL: {result}")
-            created.append((issue_file.name, issue_number, result))
-        else:
-            print(f"✗ Failed")
-            print(f"  Error: {result}")
-            failed.append((issue_file.name, result))
+        # Runs on the worker as soon as the issue is created, not when the
+        # report below gets to it
+        def on_done(future):
+            if not future.cancelled():
+                success, issue_number, _ = future.result()
+                if success:
+                    record_created([(issue_data['title'], issue_number)])
+
+        future.add_done_callback(on_done)
+        return future
+
+    with session, ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        try:
+            batchable = []
+            futures = {}
+            for issue in issues:
+                filename, issue_data, _ = issue
+                if label_ids is not None and all(label in label_ids for label in issue_data.get('labels', [])):
+                    batchable.append(issue)
+                else:
+                    futures[filename] = submit_rest(executor, issue)
+
+            batched = {}
+            titles = {filename: issue_data['title'] for filename, issue_data, _ in batchable}
+            for results in create_issues_graphql(session, batchable, limiter, repository_id, label_ids):
+                batched.update(results)
+                record_created([
+                    (titles[filename], issue_number)
+                    for filename, (success, issue_number, _) in results.items() if success
+                ])
+            for issue in batchable:
+                filename, _, _ = issue
+                if filename not in batched:
+                    futures[filename] = submit_rest(executor, issue)
+
+            # Only this thread reports progress, one write per issue, so output
+            # from concurrent workers never interleaves
+            for filename, _, _ in issues:
+                if filename in batched:
+                    success, issue_number, result = batched[filename]
+                else:
+                    success, issue_number, result = futures[filename].result()
 
-        # Rate limiting: wait 1 second between requests
-        time.sleep(1)
+                if success:
+                    sys.stdout.write(f"Creating: {filename}... ✓ #{issue_number}\n  URL: {result}\n")
+                    created.append((filename, issue_number, result))
+                else:
+                    sys.stderr.write(f"Creating: {filename}... ✗ Failed\n  Error: {result}\n")
+                    failed.append((filename, result))
+        except KeyboardInterrupt:
+            # Drop queued issues instead of creating them on the way out;
+            # ones already in flight still finish and are recorded
+            executor.shutdown(cancel_futures=True)
+            raise
 
     print()
     print("=" * 60)
     print("  Summary")
     print("=" * 60)
     print(f"Total issues: {len(issue_files)}")
+    print(f"Skipped:      {len(skipped)} (already exist)")
     print(f"Created:      {len(created)} ✓")
     print(f"Failed:       {len(failed)} ✗")
     print()